@@ -12,20 +12,43 @@ Printing workflow:
 4. Bottom surface shows black text/border flush with white background
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 import argparse
-import math
+import functools
 import sys
 
-import cadquery as cq
+import numpy as np
+
+# cadquery drags in the OCP/OpenCascade binary (multi-second import on a
+# cold cache), so it is loaded lazily via _load_cq(); --help and argument
+# errors never pay for it.
+cq = None
+
+
+def _load_cq():
+    """Import cadquery and the OCP helpers on first use."""
+    global cq, BRepBuilderAPI_MakeEdge, BRepBuilderAPI_MakeWire
+    global GC_MakeArcOfCircle, gp_Pnt
+    if cq is None:
+        import cadquery
+        from OCP.BRepBuilderAPI import BRepBuilderAPI_MakeEdge, BRepBuilderAPI_MakeWire
+        from OCP.GC import GC_MakeArcOfCircle
+        from OCP.gp import gp_Pnt
+        cq = cadquery
 
 
 CHAR_WIDTH_RATIO = 0.55  # Approximate average character width / font size
+_COS45 = 0.7071067811865476  # math.cos(math.pi / 4)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StyledRun:
-    """A run of text with uniform styling."""
+    """A run of text with uniform styling.
+
+    Frozen and slotted: the GUI allocates one per text fragment on every
+    document change, and hashability lets caches key on runs directly.
+    """
     text: str
     bold: bool = False
     italic: bool = False
@@ -39,9 +62,9 @@ class StyledRun:
         return cls(text=d["text"], bold=d.get("bold", False), italic=d.get("italic", False), underline=d.get("underline", False))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SignParams:
-    """Parameters for name sign generation."""
+    """Parameters for name sign generation. Immutable once built."""
 
     lines: list[str] = field(default_factory=lambda: ["Her bor", "Ola Nordmann"])
     styled_lines: list[list[StyledRun]] | None = None  # Per-run styling (overrides lines + bold/italic/underline)
@@ -108,63 +131,99 @@ def _clamp_radius(r, w, h):
 # ---------------------------------------------------------------------------
 
 
+def _rect_wire(w, h):
+    """Create a closed rectangular Wire centered on the origin."""
+    _load_cq()
+    hw, hh = w / 2, h / 2
+    return cq.Wire.makePolygon([
+        cq.Vector(-hw, -hh), cq.Vector(hw, -hh), cq.Vector(hw, hh),
+        cq.Vector(-hw, hh), cq.Vector(-hw, -hh),
+    ])
+
+
+def _build_plaque_wire(w, h, r, m):
+    """Build the 8-edge plaque Wire directly at the OCP level.
+
+    Alternates straight edges with corner arcs whose midpoints sit at
+    distance m from each corner along both axes (m = r*cos45 gives the
+    concave plaque, m = r*(1-cos45) the rounded rectangle). Bypassing
+    the Workplane DSL skips its context-stack and coordinate-parsing
+    overhead for what is a fixed 8-edge outline.
+    """
+    _load_cq()
+    hw, hh = w / 2, h / 2
+    # Points in CCW order: line start, line end / arc start, arc mid,
+    # repeating for all four sides (arc end = next line start).
+    pts = [
+        (-hw + r, -hh), (hw - r, -hh), (hw - m, -hh + m),
+        (hw, -hh + r), (hw, hh - r), (hw - m, hh - m),
+        (hw - r, hh), (-hw + r, hh), (-hw + m, hh - m),
+        (-hw, hh - r), (-hw, -hh + r), (-hw + m, -hh + m),
+    ]
+
+    maker = BRepBuilderAPI_MakeWire()
+    for i in range(0, 12, 3):
+        start = gp_Pnt(pts[i][0], pts[i][1], 0)
+        arc_start = gp_Pnt(pts[i + 1][0], pts[i + 1][1], 0)
+        arc_mid = gp_Pnt(pts[i + 2][0], pts[i + 2][1], 0)
+        arc_end = gp_Pnt(pts[(i + 3) % 12][0], pts[(i + 3) % 12][1], 0)
+        maker.Add(BRepBuilderAPI_MakeEdge(start, arc_start).Edge())
+        maker.Add(BRepBuilderAPI_MakeEdge(
+            GC_MakeArcOfCircle(arc_start, arc_mid, arc_end).Value()
+        ).Edge())
+
+    return cq.Wire(maker.Wire())
+
+
 def _create_concave_wire(w, h, r):
-    """Create a 2D closed wire for a concave plaque outline."""
+    """Create a closed Wire for a concave plaque outline."""
     r = _clamp_radius(r, w, h)
     if r < 0.1:
-        return cq.Workplane("XY").rect(w, h)
-
-    hw, hh = w / 2, h / 2
-    k = r * math.cos(math.pi / 4)  # r * 0.7071
-
-    return (
-        cq.Workplane("XY")
-        .moveTo(-hw + r, -hh)
-        .lineTo(hw - r, -hh)
-        .threePointArc((hw - k, -hh + k), (hw, -hh + r))
-        .lineTo(hw, hh - r)
-        .threePointArc((hw - k, hh - k), (hw - r, hh))
-        .lineTo(-hw + r, hh)
-        .threePointArc((-hw + k, hh - k), (-hw, hh - r))
-        .lineTo(-hw, -hh + r)
-        .threePointArc((-hw + k, -hh + k), (-hw + r, -hh))
-        .close()
-    )
+        return _rect_wire(w, h)
+    return _build_plaque_wire(w, h, r, r * _COS45)
 
 
 def _create_rounded_wire(w, h, r):
-    """Create a 2D closed wire for a rounded rectangle."""
+    """Create a closed Wire for a rounded rectangle."""
     r = _clamp_radius(r, w, h)
     if r < 0.1:
-        return cq.Workplane("XY").rect(w, h)
+        return _rect_wire(w, h)
+    # Arc midpoints sit r*(1-cos45) in from each corner
+    return _build_plaque_wire(w, h, r, r * (1 - _COS45))
 
-    hw, hh = w / 2, h / 2
-    # a = distance from corner to arc midpoint along each axis
-    a = r * (1 - math.cos(math.pi / 4))  # r * 0.2929
-
-    return (
-        cq.Workplane("XY")
-        .moveTo(-hw + r, -hh)
-        .lineTo(hw - r, -hh)
-        .threePointArc((hw - a, -hh + a), (hw, -hh + r))
-        .lineTo(hw, hh - r)
-        .threePointArc((hw - a, hh - a), (hw - r, hh))
-        .lineTo(-hw + r, hh)
-        .threePointArc((-hw + a, hh - a), (-hw, hh - r))
-        .lineTo(-hw, -hh + r)
-        .threePointArc((-hw + a, -hh + a), (-hw + r, -hh))
-        .close()
-    )
+
+# Style name -> wire builder; unknown styles fall back to a plain rect
+_OUTLINE_BUILDERS = {
+    "concave": _create_concave_wire,
+    "rounded": _create_rounded_wire,
+}
 
 
 def _create_outline_wire(w, h, r, style):
-    """Create a 2D closed wire based on border style."""
-    if style == "concave":
-        return _create_concave_wire(w, h, r)
-    elif style == "rounded":
-        return _create_rounded_wire(w, h, r)
-    else:
-        return cq.Workplane("XY").rect(w, h)
+    """Create a closed Wire based on border style."""
+    builder = _OUTLINE_BUILDERS.get(style)
+    if builder is None:
+        return _rect_wire(w, h)
+    return builder(w, h, r)
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_outline_wire(w, h, r, style):
+    """Build (and memoize) the underlying Wire for an outline."""
+    return _create_outline_wire(w, h, r, style)
+
+
+def _outline_workplane(w, h, r, style):
+    """Return a fresh Workplane carrying the (cached) outline wire.
+
+    A sign build needs the same outline three times (plate, outer border
+    offset, inner border offset). Each caller gets a copy so OCCT sees an
+    independent TopoDS handle, but the wire itself is only constructed
+    once per (w, h, r, style).
+    """
+    _load_cq()
+    wire = _cached_outline_wire(w, h, r, style).copy()
+    return cq.Workplane("XY").add(wire).toPending()
 
 
 # ---------------------------------------------------------------------------
@@ -174,7 +233,7 @@ def _create_outline_wire(w, h, r, style):
 
 def _create_outline_solid(w, h, r, style, depth):
     """Create a plate outline solid based on border style."""
-    return _create_outline_wire(w, h, r, style).extrude(depth)
+    return _outline_workplane(w, h, r, style).extrude(depth)
 
 
 def _create_border_frame(params):
@@ -192,14 +251,15 @@ def _create_border_frame(params):
         return None
 
     try:
-        # Create separate wires for each offset (CadQuery shares context
-        # between wire/offset, so extrude on one consumes the other's state)
-        wire1 = _create_outline_wire(
+        # Separate workplanes for each offset (CadQuery shares context
+        # between wire/offset, so extrude on one consumes the other's
+        # state); the outline wire itself comes from the shared cache.
+        wire1 = _outline_workplane(
             params.width, params.height, params.corner_radius, params.border_style
         )
         outer_solid = wire1.offset2D(-off, kind="arc").extrude(params.text_depth)
 
-        wire2 = _create_outline_wire(
+        wire2 = _outline_workplane(
             params.width, params.height, params.corner_radius, params.border_style
         )
         inner_solid = wire2.offset2D(-(off + bw), kind="arc").extrude(params.text_depth)
@@ -227,6 +287,33 @@ def _create_border_frame(params):
         return outer_s.cut(inner_s)
 
 
+def _underline_solid(rects, depth):
+    """Extrude underline rectangles (cx, cy, w, h) as one solid.
+
+    Collecting every rectangle into a single Sketch means one BRep
+    extrude and one argument in the final fuse, instead of a separate
+    Workplane per underlined sub-run.
+    """
+    _load_cq()
+    sk = cq.Sketch()
+    for cx, cy, w, h in rects:
+        sk = sk.push([(cx, cy)]).rect(w, h)
+    return cq.Workplane("XY").placeSketch(sk).extrude(depth)
+
+
+def _fuse_all(parts):
+    """Fuse a list of Workplane solids in a single boolean pass.
+
+    Chaining `.union()` re-runs the full fuse algorithm over the growing
+    accumulator (O(n^2) in part count); handing every shape to one
+    multi-argument fuse lets OCCT process them in a single pass.
+    """
+    _load_cq()
+    if len(parts) == 1:
+        return parts[0]
+    return cq.Workplane("XY").newObject([p.val() for p in parts]).combine()
+
+
 def _get_line_texts(params):
     """Get plain text for each line, from styled_lines if available."""
     if params.styled_lines is not None:
@@ -240,41 +327,56 @@ def auto_font_sizes(params):
     Computes the largest font size that fits all lines within the available
     space, then returns that same size for every line.
     """
-    lines = _get_line_texts(params)
+    return list(_auto_font_sizes_cached(
+        tuple(_get_line_texts(params)),
+        params.width, params.height, params.border_style,
+        params.border_offset, params.border_width,
+        params.corner_radius, params.line_spacing,
+        params.font, params.bold, params.italic,
+    ))
+
+
+@functools.lru_cache(maxsize=32)
+def _auto_font_sizes_cached(lines, width, height, border_style, border_offset,
+                            border_width, corner_radius, line_spacing,
+                            font, bold, italic):
+    """Memoized worker for auto_font_sizes.
+
+    Called once per sign in main() for the printout and again inside
+    _create_text_solids; the cache makes the second pass free.
+    """
     n = len(lines)
     if n == 0:
-        return []
+        return ()
 
-    non_empty = [l for l in lines if l.strip()]
-    if not non_empty:
-        return [10.0] * n
+    unit_widths = np.fromiter(
+        (_text_unit_width(l.strip(), font, bold, italic)
+         for l in lines if l.strip()),
+        dtype=np.float64,
+    )
+    if unit_widths.size == 0:
+        return (10.0,) * n
 
     # Determine available space inside border
-    if params.border_style != "none" and params.border_width > 0:
-        padding = params.border_offset + params.border_width + 3
+    if border_style != "none" and border_width > 0:
+        padding = border_offset + border_width + 3
     else:
-        padding = max(params.corner_radius * 0.5, 4)
+        padding = max(corner_radius * 0.5, 4)
 
-    available_w = params.width - 2 * padding
-    available_h = params.height - 2 * padding
+    available_w = width - 2 * padding
+    available_h = height - 2 * padding
 
     if available_w <= 0 or available_h <= 0:
-        return [5.0] * n
+        return (5.0,) * n
 
     # Base size from available height
-    n_text = len(non_empty)
-    base_size = available_h / (1 + (n_text - 1) * params.line_spacing)
+    base_size = available_h / (1 + (unit_widths.size - 1) * line_spacing)
 
     # Cap by the widest line so all lines use the same size
-    uniform = base_size
-    for line in lines:
-        text = line.strip()
-        if not text:
-            continue
-        max_w = available_w / (len(text) * CHAR_WIDTH_RATIO)
-        uniform = min(uniform, max_w)
+    max_widths = available_w / unit_widths
+    uniform = float(min(base_size, max_widths.min()))
 
-    return [uniform] * n
+    return (uniform,) * n
 
 
 def _calc_line_positions(line_data, line_spacing):
@@ -305,22 +407,40 @@ def _calc_line_positions(line_data, line_spacing):
     return y_positions
 
 
-def _find_font_path(font_name, bold=False, italic=False):
-    """Try to find a system font file path for a given style combination.
+@functools.lru_cache(maxsize=None)
+def _fonts_by_name():
+    """Map lowercase filename -> Path for every installed font file.
 
-    Returns the path string if found, or None.
+    The fonts directory is listed once; later lookups probe this
+    in-memory dict instead of issuing stat calls per candidate name.
+    Returns an empty dict on non-Windows systems.
     """
     import platform
     from pathlib import Path
 
     if platform.system() != "Windows":
-        return None
+        return {}
 
     fonts_dir = Path("C:/Windows/Fonts")
     if not fonts_dir.exists():
+        return {}
+
+    return {p.name.lower(): p for p in fonts_dir.iterdir()}
+
+
+@functools.lru_cache(maxsize=None)
+def _find_font_path(font_name, bold=False, italic=False):
+    """Try to find a system font file path for a given style combination.
+
+    Returns the path string if found, or None. Cached: per-run styling
+    can request the same (font, bold, italic) tuple many times per sign.
+    """
+    fonts = _fonts_by_name()
+    if not fonts:
         return None
 
-    # Common font file naming conventions
+    # Common font file naming conventions (keys are lowercased, so this
+    # also covers uppercase filenames)
     name_lower = font_name.lower().replace(" ", "")
     suffixes = []
     if bold and italic:
@@ -332,18 +452,13 @@ def _find_font_path(font_name, bold=False, italic=False):
 
     for suffix in suffixes:
         for ext in [".ttf", ".otf"]:
-            candidate = fonts_dir / f"{name_lower}{suffix}{ext}"
-            if candidate.exists():
-                return str(candidate)
-            # Try uppercase
-            candidate = fonts_dir / f"{name_lower}{suffix}{ext}".upper()
-            if candidate.exists():
+            candidate = fonts.get(f"{name_lower}{suffix}{ext}")
+            if candidate is not None:
                 return str(candidate)
 
     # Case-insensitive search as last resort
     target_prefix = name_lower
-    for f in fonts_dir.iterdir():
-        fn = f.name.lower()
+    for fn, f in fonts.items():
         if fn.startswith(target_prefix) and fn.endswith((".ttf", ".otf")):
             if bold and italic and any(s in fn for s in ["bi", "bolditalic"]):
                 return str(f)
@@ -357,6 +472,45 @@ def _find_font_path(font_name, bold=False, italic=False):
     return None
 
 
+@functools.lru_cache(maxsize=8)
+def _glyph_advances(font_path):
+    """Load per-character advance widths (em fractions) from a font file.
+
+    Returns {char: advance / units_per_em}, or None when fontTools is
+    not installed, the path is unknown, or the font cannot be parsed.
+    """
+    if not font_path:
+        return None
+    try:
+        from fontTools.ttLib import TTFont
+    except ImportError:
+        return None
+    try:
+        tt = TTFont(font_path)
+        upem = tt["head"].unitsPerEm
+        hmtx = tt["hmtx"]
+        return {
+            chr(cp): hmtx[name][0] / upem
+            for cp, name in tt.getBestCmap().items()
+        }
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _text_unit_width(text, font, bold=False, italic=False):
+    """Width of text at font size 1.0.
+
+    Uses real glyph advances when the font file can be located and
+    parsed; otherwise falls back to the CHAR_WIDTH_RATIO estimate.
+    """
+    advances = _glyph_advances(_find_font_path(font, bold, italic))
+    if advances:
+        # CHAR_WIDTH_RATIO stands in for characters missing from the cmap
+        return sum(advances.get(c, CHAR_WIDTH_RATIO) for c in text)
+    return len(text) * CHAR_WIDTH_RATIO
+
+
 def _text_kwargs_for_style(font, bold, italic):
     """Build CadQuery text() kwargs for a given bold/italic combination."""
     kwargs = dict(halign="center", valign="center")
@@ -379,6 +533,35 @@ def _text_kwargs_for_style(font, bold, italic):
     return kwargs
 
 
+@functools.lru_cache(maxsize=64)
+def _build_text_solid(text, size, depth, font, kind, font_path):
+    """Build (and memoize) a centered text solid at the origin.
+
+    Glyph triangulation inside text() is the expensive part; caching the
+    origin-centered solid lets repeated strings (same font and size,
+    which auto sizing makes the common case) be re-placed with a cheap
+    transform instead of re-tessellated.
+    """
+    _load_cq()
+    kwargs = dict(halign="center", valign="center")
+    if font_path:
+        kwargs["fontPath"] = font_path
+    else:
+        kwargs["font"] = font
+        kwargs["kind"] = kind
+    return cq.Workplane("XY").text(text, size, depth, **kwargs)
+
+
+def _positioned_text_solid(text, size, depth, font, bold, italic, cx, cy):
+    """Return a text solid centered at (cx, cy), reusing cached glyphs."""
+    kwargs = _text_kwargs_for_style(font, bold, italic)
+    solid = _build_text_solid(
+        text, size, depth,
+        kwargs.get("font"), kwargs.get("kind"), kwargs.get("fontPath"),
+    )
+    return solid.translate((cx, cy, 0))
+
+
 def _create_text_solids(params):
     """Create extruded text solids for all lines.
 
@@ -387,6 +570,7 @@ def _create_text_solids(params):
 
     Returns a CadQuery Workplane with combined text solids, or None if no text.
     """
+    _load_cq()
     line_texts = _get_line_texts(params)
     non_empty_indices = [i for i, l in enumerate(line_texts) if l.strip()]
     if not non_empty_indices:
@@ -410,6 +594,7 @@ def _create_text_solids(params):
     UL_Y_OFFSET = 0.35  # fraction of font_size below center
 
     solids = []
+    ul_rects = []  # (cx, cy, w, h), extruded together at the end
 
     if params.styled_lines is not None:
         # Per-run styling: group consecutive runs by (bold, italic) into
@@ -441,107 +626,79 @@ def _create_text_solids(params):
             # If there's only one text group, render centered (no CHAR_WIDTH_RATIO error)
             if len(groups) == 1:
                 g_text, g_bold, g_italic, g_runs = groups[0]
-                kwargs = _text_kwargs_for_style(params.font, g_bold, g_italic)
                 try:
-                    solid = (
-                        cq.Workplane("XY")
-                        .center(0, y)
-                        .text(g_text, font_size, params.text_depth, **kwargs)
-                    )
-                    solids.append(solid)
+                    solids.append(_positioned_text_solid(
+                        g_text, font_size, params.text_depth,
+                        params.font, g_bold, g_italic, 0, y,
+                    ))
                 except Exception as e:
                     print(f"Warning: Could not render text '{g_text}': {e}", file=sys.stderr)
 
                 # Underline rectangles per sub-run
-                full_w = len(g_text) * CHAR_WIDTH_RATIO * font_size
+                full_w = _text_unit_width(g_text, params.font, g_bold, g_italic) * font_size
                 char_x = -full_w / 2
                 for sub_text, sub_ul in g_runs:
-                    sub_w = len(sub_text) * CHAR_WIDTH_RATIO * font_size
+                    sub_w = _text_unit_width(sub_text, params.font, g_bold, g_italic) * font_size
                     if sub_ul:
                         ul_thickness = max(0.4, font_size * 0.06)
                         ul_y = y - font_size * UL_Y_OFFSET
-                        ul = (
-                            cq.Workplane("XY")
-                            .center(char_x + sub_w / 2, ul_y)
-                            .rect(sub_w, ul_thickness)
-                            .extrude(params.text_depth)
-                        )
-                        solids.append(ul)
+                        ul_rects.append((char_x + sub_w / 2, ul_y, sub_w, ul_thickness))
                     char_x += sub_w
             else:
-                # Multiple font-style groups: position each using CHAR_WIDTH_RATIO
-                full_text = "".join(g[0] for g in groups)
-                total_w = len(full_text) * CHAR_WIDTH_RATIO * font_size
-                x = -total_w / 2
-
-                for g_text, g_bold, g_italic, g_runs in groups:
-                    g_w = len(g_text) * CHAR_WIDTH_RATIO * font_size
+                # Multiple font-style groups: position each using measured widths
+                group_ws = [
+                    _text_unit_width(g[0], params.font, g[1], g[2]) * font_size
+                    for g in groups
+                ]
+                x = -sum(group_ws) / 2
+
+                for (g_text, g_bold, g_italic, g_runs), g_w in zip(groups, group_ws):
                     g_cx = x + g_w / 2
 
-                    kwargs = _text_kwargs_for_style(params.font, g_bold, g_italic)
                     try:
-                        solid = (
-                            cq.Workplane("XY")
-                            .center(g_cx, y)
-                            .text(g_text, font_size, params.text_depth, **kwargs)
-                        )
-                        solids.append(solid)
+                        solids.append(_positioned_text_solid(
+                            g_text, font_size, params.text_depth,
+                            params.font, g_bold, g_italic, g_cx, y,
+                        ))
                     except Exception as e:
                         print(f"Warning: Could not render text '{g_text}': {e}", file=sys.stderr)
 
                     # Underline rectangles per sub-run within this group
                     char_x = x
                     for sub_text, sub_ul in g_runs:
-                        sub_w = len(sub_text) * CHAR_WIDTH_RATIO * font_size
+                        sub_w = _text_unit_width(sub_text, params.font, g_bold, g_italic) * font_size
                         if sub_ul:
                             ul_thickness = max(0.4, font_size * 0.06)
                             ul_y = y - font_size * UL_Y_OFFSET
-                            ul = (
-                                cq.Workplane("XY")
-                                .center(char_x + sub_w / 2, ul_y)
-                                .rect(sub_w, ul_thickness)
-                                .extrude(params.text_depth)
-                            )
-                            solids.append(ul)
+                            ul_rects.append((char_x + sub_w / 2, ul_y, sub_w, ul_thickness))
                         char_x += sub_w
 
                     x += g_w
     else:
         # Global styling (CLI mode)
-        text_kwargs = _text_kwargs_for_style(params.font, params.bold, params.italic)
-
         for i, (text, font_size) in enumerate(line_data):
             y = y_positions[i]
             try:
-                solid = (
-                    cq.Workplane("XY")
-                    .center(0, y)
-                    .text(text, font_size, params.text_depth, **text_kwargs)
-                )
-                solids.append(solid)
+                solids.append(_positioned_text_solid(
+                    text, font_size, params.text_depth,
+                    params.font, params.bold, params.italic, 0, y,
+                ))
             except Exception as e:
                 print(f"Warning: Could not render text '{text}': {e}", file=sys.stderr)
 
             if params.underline:
-                text_w = font_size * len(text) * CHAR_WIDTH_RATIO
+                text_w = _text_unit_width(text, params.font, params.bold, params.italic) * font_size
                 ul_thickness = max(0.4, font_size * 0.06)
                 ul_y = y - font_size * UL_Y_OFFSET
-                ul = (
-                    cq.Workplane("XY")
-                    .center(0, ul_y)
-                    .rect(text_w, ul_thickness)
-                    .extrude(params.text_depth)
-                )
-                solids.append(ul)
+                ul_rects.append((0, ul_y, text_w, ul_thickness))
+
+    if ul_rects:
+        solids.append(_underline_solid(ul_rects, params.text_depth))
 
     if not solids:
         return None
 
-    combined = solids[0]
-    for s in solids[1:]:
-        combined = combined.union(s)
-
-    return combined
+    return _fuse_all(solids)
 
 
 def generate_sign(params):
@@ -552,6 +709,7 @@ def generate_sign(params):
         black_piece contains text + border (thin, printed first).
         white_piece is the full plate with voids for the black piece.
     """
+    _load_cq()
     plate = _create_outline_solid(
         params.width, params.height, params.corner_radius,
         params.border_style, params.thickness,
@@ -569,9 +727,7 @@ def generate_sign(params):
     if not black_parts:
         return None, plate
 
-    black_combined = black_parts[0]
-    for part in black_parts[1:]:
-        black_combined = black_combined.union(part)
+    black_combined = _fuse_all(black_parts)
 
     # Mirror across YZ plane so text reads correctly from bed side (z=0)
     black_piece = black_combined.mirror("YZ")
@@ -582,9 +738,18 @@ def generate_sign(params):
     return black_piece, white_piece
 
 
-def export_stl(shape, filename):
-    """Export a CadQuery shape to STL file."""
-    cq.exporters.export(shape, filename)
+def export_stl(shape, filename, tolerance=0.05, angular_tolerance=0.2):
+    """Export a CadQuery shape to STL file.
+
+    Deflection defaults are coarser than CadQuery's: the smallest
+    feature on a sign is letter curvature well above 0.05 mm, and
+    BRepMesh work scales with 1/deflection^2, so this keeps meshes
+    visually identical while cutting export time and file size.
+    """
+    _load_cq()
+    cq.exporters.export(
+        shape, filename, tolerance=tolerance, angularTolerance=angular_tolerance
+    )
 
 
 def main():
@@ -613,6 +778,14 @@ def main():
     parser.add_argument("--border-offset", type=float, default=6, help="Edge to border distance (mm)")
     parser.add_argument("--border-width", type=float, default=2, help="Border line width (mm)")
     parser.add_argument("--line-spacing", type=float, default=1.3, help="Line spacing multiplier")
+    parser.add_argument(
+        "--stl-tolerance", type=float, default=0.05,
+        help="STL linear deflection (mm); smaller = finer mesh",
+    )
+    parser.add_argument(
+        "--stl-angular-tolerance", type=float, default=0.2,
+        help="STL angular deflection (radians)",
+    )
     parser.add_argument("-o", "--output", default="namesign", help="Output filename prefix")
 
     args = parser.parse_args()
@@ -653,6 +826,8 @@ def main():
     if params.sizes:
         print(f"  Font sizes: {params.sizes}")
     else:
+        # Memoized: _create_text_solids reuses this exact result during
+        # generation rather than recomputing it.
         sizes = auto_font_sizes(params)
         print(f"  Auto font size: {sizes[0]:.1f} mm")
 
@@ -662,12 +837,22 @@ def main():
     white_file = f"{params.output}_white.stl"
 
     if black is not None:
-        export_stl(black, black_file)
+        # The pieces are independent and OCCT's meshing releases the GIL,
+        # so both tessellations run in parallel.
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            futures = [
+                ex.submit(export_stl, black, black_file,
+                          args.stl_tolerance, args.stl_angular_tolerance),
+                ex.submit(export_stl, white, white_file,
+                          args.stl_tolerance, args.stl_angular_tolerance),
+            ]
+            for future in futures:
+                future.result()
         print(f"  Exported: {black_file}")
     else:
         print("  No black piece (no text or border)")
+        export_stl(white, white_file, args.stl_tolerance, args.stl_angular_tolerance)
 
-    export_stl(white, white_file)
     print(f"  Exported: {white_file}")
     print("Done!")
 
@@ -8,8 +8,11 @@ Live 2D preview with QPainter, exports STLs via CadQuery in a background thread.
 import json
 import math
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
+
 from PySide6.QtWidgets import (
     QApplication,
     QComboBox,
@@ -31,7 +34,7 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
-from PySide6.QtCore import Qt, QThread, Signal, QRectF
+from PySide6.QtCore import Qt, QThread, QTimer, Signal, QPointF, QRectF
 from PySide6.QtGui import (
     QColor,
     QFont,
@@ -39,6 +42,8 @@ from PySide6.QtGui import (
     QPainter,
     QPainterPath,
     QPen,
+    QPixmap,
+    QPolygonF,
     QTextCharFormat,
     QTextCursor,
 )
@@ -46,11 +51,148 @@ from PySide6.QtGui import (
 from namesign import SignParams, StyledRun, auto_font_sizes, _calc_line_positions, CHAR_WIDTH_RATIO
 
 
+# ---------------------------------------------------------------------------
+# Font caching
+# ---------------------------------------------------------------------------
+#
+# QFont construction and metrics queries hit the Qt font database; with a
+# live preview repainting on every keystroke that cost dominates, so fonts,
+# metrics, and advances are memoized at module level.
+
+
+@lru_cache(maxsize=256)
+def _cached_font(family, pixel_size, bold, italic):
+    font = QFont(family)
+    font.setPixelSize(pixel_size)
+    font.setBold(bold)
+    font.setItalic(italic)
+    return font
+
+
+@lru_cache(maxsize=256)
+def _cached_metrics(family, pixel_size, bold, italic):
+    return QFontMetricsF(_cached_font(family, pixel_size, bold, italic))
+
+
+@lru_cache(maxsize=1024)
+def _cached_advance(family, pixel_size, bold, italic, text):
+    return _cached_metrics(family, pixel_size, bold, italic).horizontalAdvance(text)
+
+
+@lru_cache(maxsize=256)
+def _cached_draw_font(family, pixel_size, bold, italic, underline):
+    """Font for drawing; underlined variants are copies so the shared
+    measurement fonts are never mutated."""
+    if not underline:
+        return _cached_font(family, pixel_size, bold, italic)
+    font = QFont(_cached_font(family, pixel_size, bold, italic))
+    font.setUnderline(True)
+    return font
+
+
 # ---------------------------------------------------------------------------
 # Outline sampling for proper offset preview
 # ---------------------------------------------------------------------------
 
 
+_ARC_T = np.arange(1, 17) / 16.0  # sweep fractions for 16-segment arcs
+
+
+def _concave_vertices_loop(hw, hh, r, d, n_arc):
+    """Vertices of the concave outline offset inward by d, in draw order.
+
+    Returns a (4*n_arc + 5, 2) float64 array starting at the bottom-left
+    junction. Purely numeric so numba can compile it; callers handle the
+    degenerate (rectangle) cases before calling.
+    """
+    R = r + d
+    s = (R * R - d * d) ** 0.5
+    out = np.empty((4 * n_arc + 5, 2))
+    out[0, 0] = -hw + s
+    out[0, 1] = -hh + d
+    out[1, 0] = hw - s
+    out[1, 1] = -hh + d
+
+    # Corner centers, arc start/end points, and the straight-edge point
+    # that follows each arc (the last edge is closed by the caller)
+    cxs = (hw, hw, -hw, -hw)
+    cys = (-hh, hh, hh, -hh)
+    x1s = (hw - s, hw - d, -hw + s, -hw + d)
+    y1s = (-hh + d, hh - s, hh - d, -hh + s)
+    x2s = (hw - d, hw - s, -hw + d, -hw + s)
+    y2s = (-hh + s, hh - d, hh - s, -hh + d)
+    exs = (hw - d, -hw + s, -hw + d)
+    eys = (hh - s, hh - d, -hh + s)
+
+    idx = 2
+    for c in range(4):
+        a1 = math.atan2(y1s[c] - cys[c], x1s[c] - cxs[c])
+        a2 = math.atan2(y2s[c] - cys[c], x2s[c] - cxs[c])
+        delta = a2 - a1
+        if delta > 0:
+            delta -= 2 * math.pi  # ensure clockwise sweep
+        for i in range(1, n_arc + 1):
+            a = a1 + delta * i / n_arc
+            out[idx, 0] = cxs[c] + R * math.cos(a)
+            out[idx, 1] = cys[c] + R * math.sin(a)
+            idx += 1
+        if c < 3:
+            out[idx, 0] = exs[c]
+            out[idx, 1] = eys[c]
+            idx += 1
+    return out
+
+
+def _concave_vertices_np(hw, hh, r, d, n_arc):
+    """Vectorized twin of _concave_vertices_loop.
+
+    All four corner arcs are evaluated with one np.cos/np.sin pair over
+    a (4, n_arc) angle grid; same output, no per-vertex Python work.
+    """
+    R = r + d
+    s = math.sqrt(R * R - d * d)
+
+    cx = np.array([hw, hw, -hw, -hw])
+    cy = np.array([-hh, hh, hh, -hh])
+    x1 = np.array([hw - s, hw - d, -hw + s, -hw + d])
+    y1 = np.array([-hh + d, hh - s, hh - d, -hh + s])
+    x2 = np.array([hw - d, hw - s, -hw + d, -hw + s])
+    y2 = np.array([-hh + s, hh - d, hh - s, -hh + d])
+
+    a1 = np.arctan2(y1 - cy, x1 - cx)
+    a2 = np.arctan2(y2 - cy, x2 - cx)
+    delta = a2 - a1
+    delta[delta > 0] -= 2 * np.pi  # ensure clockwise sweep
+
+    t = _ARC_T if n_arc == 16 else np.arange(1, n_arc + 1) / n_arc
+    angles = a1[:, None] + delta[:, None] * t[None, :]
+    xs = cx[:, None] + R * np.cos(angles)
+    ys = cy[:, None] + R * np.sin(angles)
+
+    out = np.empty((4 * n_arc + 5, 2))
+    out[0] = (-hw + s, -hh + d)
+    out[1] = (hw - s, -hh + d)
+    edges = ((hw - d, hh - s), (-hw + s, hh - d), (-hw + d, -hh + s))
+    idx = 2
+    for c in range(4):
+        out[idx:idx + n_arc, 0] = xs[c]
+        out[idx:idx + n_arc, 1] = ys[c]
+        idx += n_arc
+        if c < 3:
+            out[idx] = edges[c]
+            idx += 1
+    return out
+
+
+try:
+    # Optional: numba compiles the loop kernel to native code.
+    # cache=True so the compile cost is paid once per install, not per run.
+    from numba import njit
+    _concave_vertices = njit(cache=True, fastmath=True)(_concave_vertices_loop)
+except ImportError:
+    _concave_vertices = _concave_vertices_np
+
+
 def _build_offset_concave_path(hw, hh, r, d, n_arc=16):
     """Build a QPainterPath for the concave outline offset inward by d.
 
@@ -58,6 +200,11 @@ def _build_offset_concave_path(hw, hh, r, d, n_arc=16):
     their center at the plate corner but grow radius to r+d.  Junction
     points are computed analytically.
     """
+    if d == 0:
+        # No offset: this is exactly the base concave outline, which the
+        # outline builder already produces with arcTo Beziers
+        return PreviewWidget._build_outline_path(2 * hw, 2 * hh, r, "concave")
+
     R = r + d  # offset arc radius
     path = QPainterPath()
 
@@ -77,50 +224,14 @@ def _build_offset_concave_path(hw, hh, r, d, n_arc=16):
         path.addRect(QRectF(-(hw - d), -(hh - d), 2 * (hw - d), 2 * (hh - d)))
         return path
 
-    # Start at bottom-left junction with bottom edge
-    path.moveTo(-hw + s, -hh + d)
-
-    # Bottom edge
-    path.lineTo(hw - s, -hh + d)
-
-    # BR arc: center (hw, -hh), from (hw-s, -hh+d) to (hw-d, -hh+s)
-    _add_offset_arc(path, hw, -hh, R, hw - s, -hh + d, hw - d, -hh + s, n_arc)
-
-    # Right edge
-    path.lineTo(hw - d, hh - s)
-
-    # TR arc: center (hw, hh), from (hw-d, hh-s) to (hw-s, hh-d)
-    _add_offset_arc(path, hw, hh, R, hw - d, hh - s, hw - s, hh - d, n_arc)
-
-    # Top edge
-    path.lineTo(-hw + s, hh - d)
-
-    # TL arc: center (-hw, hh), from (-hw+s, hh-d) to (-hw+d, hh-s)
-    _add_offset_arc(path, -hw, hh, R, -hw + s, hh - d, -hw + d, hh - s, n_arc)
-
-    # Left edge
-    path.lineTo(-hw + d, -hh + s)
-
-    # BL arc: center (-hw, -hh), from (-hw+d, -hh+s) to (-hw+s, -hh+d)
-    _add_offset_arc(path, -hw, -hh, R, -hw + d, -hh + s, -hw + s, -hh + d, n_arc)
-
+    # One addPolygon call appends the whole vertex array instead of ~70
+    # individual lineTo crossings into Qt
+    verts = _concave_vertices(hw, hh, r, d, n_arc)
+    path.addPolygon(QPolygonF([QPointF(x, y) for x, y in verts]))
     path.closeSubpath()
     return path
 
 
-def _add_offset_arc(path, cx, cy, R, x1, y1, x2, y2, n_seg):
-    """Add arc segment from (x1,y1) to (x2,y2) on circle (cx,cy,R), clockwise."""
-    a1 = math.atan2(y1 - cy, x1 - cx)
-    a2 = math.atan2(y2 - cy, x2 - cx)
-    delta = a2 - a1
-    if delta > 0:
-        delta -= 2 * math.pi  # ensure clockwise sweep
-    for i in range(1, n_seg + 1):
-        t = i / n_seg
-        a = a1 + delta * t
-        path.lineTo(cx + R * math.cos(a), cy + R * math.sin(a))
-
-
 # ---------------------------------------------------------------------------
 # Preview widget
 # ---------------------------------------------------------------------------
@@ -129,16 +240,57 @@ def _add_offset_arc(path, cx, cy, R, x1, y1, x2, y2, n_seg):
 class PreviewWidget(QWidget):
     """2D preview of the name sign using QPainter."""
 
+    # Paths are rebuilt only when their geometry inputs change; text-only
+    # edits repaint with cached outline/border paths.
+    _PATH_CACHE_MAX = 8
+    _MEASURE_CACHE_MAX = 64
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.params = SignParams()
+        self._outline_cache = {}
+        self._border_cache = {}
+        self._measure_cache = {}
+        # Rendered background + plate + border layer; text edits repaint
+        # on top of this without re-rasterizing the plate
+        self._plate_pixmap = None
+        self._plate_key = None
         self.setMinimumSize(300, 200)
 
     def set_params(self, params):
         self.params = params
-        self.update()
+        # No repaint while minimized or fully covered; the next expose
+        # event repaints with the current params anyway
+        if self.isVisible() and not self.visibleRegion().isEmpty():
+            self.update()
+
+    def _cached_outline_path(self, p):
+        """Memoized _build_outline_path keyed by the geometry inputs."""
+        key = (p.width, p.height, p.corner_radius, p.border_style)
+        path = self._outline_cache.get(key)
+        if path is None:
+            path = self._build_outline_path(
+                p.width, p.height, p.corner_radius, p.border_style
+            )
+            if len(self._outline_cache) >= self._PATH_CACHE_MAX:
+                self._outline_cache.pop(next(iter(self._outline_cache)))
+            self._outline_cache[key] = path
+        return path
+
+    def _cached_border_paths(self, p):
+        """Memoized _build_border_paths keyed by the geometry inputs."""
+        key = (p.width, p.height, p.corner_radius, p.border_style,
+               p.border_offset, p.border_width)
+        paths = self._border_cache.get(key)
+        if paths is None:
+            paths = self._build_border_paths(p)
+            if len(self._border_cache) >= self._PATH_CACHE_MAX:
+                self._border_cache.pop(next(iter(self._border_cache)))
+            self._border_cache[key] = paths
+        return paths
 
-    def _build_outline_path(self, w, h, r, style):
+    @staticmethod
+    def _build_outline_path(w, h, r, style):
         """Build a QPainterPath for the sign outline."""
         path = QPainterPath()
         hw, hh = w / 2, h / 2
@@ -148,32 +300,22 @@ class PreviewWidget(QWidget):
             path.addRoundedRect(QRectF(-hw, -hh, w, h), r, r)
         elif style == "concave" and r > 0.1:
             r = min(r, hw - 0.1, hh - 0.1)
-            segments = 16
+            # arcTo angles are y-down, hence negated vs. the y-up geometry
             path.moveTo(-hw + r, -hh)
             path.lineTo(hw - r, -hh)
-            self._add_concave_arc(path, hw, -hh, r, 180, 90, segments)
+            path.arcTo(QRectF(hw - r, -hh - r, 2 * r, 2 * r), -180, 90)
             path.lineTo(hw, hh - r)
-            self._add_concave_arc(path, hw, hh, r, 270, 180, segments)
+            path.arcTo(QRectF(hw - r, hh - r, 2 * r, 2 * r), -270, 90)
             path.lineTo(-hw + r, hh)
-            self._add_concave_arc(path, -hw, hh, r, 0, -90, segments)
+            path.arcTo(QRectF(-hw - r, hh - r, 2 * r, 2 * r), 0, 90)
             path.lineTo(-hw, -hh + r)
-            self._add_concave_arc(path, -hw, -hh, r, 90, 0, segments)
+            path.arcTo(QRectF(-hw - r, -hh - r, 2 * r, 2 * r), -90, 90)
             path.closeSubpath()
         else:
             path.addRect(QRectF(-hw, -hh, w, h))
 
         return path
 
-    @staticmethod
-    def _add_concave_arc(path, cx, cy, r, start_deg, end_deg, segments):
-        """Add a concave arc to the path (arc centered at corner)."""
-        for i in range(1, segments + 1):
-            t = i / segments
-            angle = math.radians(start_deg + (end_deg - start_deg) * t)
-            x = cx + r * math.cos(angle)
-            y = cy + r * math.sin(angle)
-            path.lineTo(x, y)
-
     def _build_border_paths(self, p):
         """Build outer and inner border paths with proper constant-distance offset.
 
@@ -212,51 +354,107 @@ class PreviewWidget(QWidget):
 
         return outer_path, inner_path
 
-    def paintEvent(self, event):
-        p = self.params
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        # Background
-        painter.fillRect(self.rect(), QColor(240, 240, 240))
-
-        if p.width <= 0 or p.height <= 0:
-            return
-
-        # Calculate scale to fit widget with margins
-        margin = 30
-        avail_w = self.width() - 2 * margin
-        avail_h = self.height() - 2 * margin
-        if avail_w <= 0 or avail_h <= 0:
-            return
+    def _measure_line(self, family, pixel_size, runs):
+        """Measure (total_w, ascent, descent, run_widths) for one line, cached.
 
-        scale = min(avail_w / p.width, avail_h / p.height)
+        Keyed on the font plus the runs' text/style, so every parameter
+        change that doesn't touch text or font reuses the measurement.
+        Ascent/descent are maxima across the runs.
+        """
+        key = (family, pixel_size,
+               tuple((r.text, r.bold, r.italic) for r in runs))
+        cached = self._measure_cache.get(key)
+        if cached is not None:
+            return cached
+
+        run_widths = []
+        total_w = 0.0
+        ascent = 0.0
+        descent = 0.0
+        for run in runs:
+            fm = _cached_metrics(family, pixel_size, run.bold, run.italic)
+            w = _cached_advance(family, pixel_size, run.bold, run.italic, run.text)
+            run_widths.append(w)
+            total_w += w
+            ascent = max(ascent, fm.ascent())
+            descent = max(descent, fm.descent())
+
+        if len(self._measure_cache) >= self._MEASURE_CACHE_MAX:
+            self._measure_cache.pop(next(iter(self._measure_cache)))
+        result = (total_w, ascent, descent, run_widths)
+        self._measure_cache[key] = result
+        return result
+
+    def _render_plate_pixmap(self, p, scale):
+        """Render background + plate + border into a pixmap at device res."""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(QColor(240, 240, 240))
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
 
-        # Center in widget, flip Y so positive Y is up
+        # Center, flip Y so positive Y is up
         painter.translate(self.width() / 2, self.height() / 2)
         painter.scale(scale, -scale)
 
         # Draw plate outline (white filled)
-        outline_path = self._build_outline_path(
-            p.width, p.height, p.corner_radius, p.border_style
-        )
+        outline_path = self._cached_outline_path(p)
         painter.setPen(QPen(QColor(180, 180, 180), 0.5 / scale))
         painter.setBrush(QColor(255, 255, 255))
         painter.drawPath(outline_path)
 
         # Draw border frame
         if p.border_style != "none" and p.border_width > 0:
-            outer_path, inner_path = self._build_border_paths(p)
+            outer_path, inner_path = self._cached_border_paths(p)
 
             if outer_path and not outer_path.isEmpty():
-                if inner_path and not inner_path.isEmpty():
-                    border_path = outer_path - inner_path
-                else:
-                    border_path = outer_path
-
+                # Fill outer black, then repaint the inside plate-white:
+                # visually identical to outer - inner without the path
+                # boolean clipping on every repaint
                 painter.setPen(Qt.NoPen)
                 painter.setBrush(QColor(0, 0, 0))
-                painter.drawPath(border_path)
+                painter.drawPath(outer_path)
+                if inner_path and not inner_path.isEmpty():
+                    painter.setBrush(QColor(255, 255, 255))
+                    painter.drawPath(inner_path)
+
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, event):
+        p = self.params
+        painter = QPainter(self)
+
+        # Calculate scale to fit widget with margins
+        margin = 30
+        avail_w = self.width() - 2 * margin
+        avail_h = self.height() - 2 * margin
+        if p.width <= 0 or p.height <= 0 or avail_w <= 0 or avail_h <= 0:
+            painter.fillRect(self.rect(), QColor(240, 240, 240))
+            return
+
+        scale = min(avail_w / p.width, avail_h / p.height)
+
+        # Blit the cached plate layer, rebuilding only when its inputs
+        # (widget size / plate geometry / border) changed
+        key = (self.width(), self.height(), self.devicePixelRatioF(),
+               p.width, p.height, p.corner_radius, p.border_style,
+               p.border_offset, p.border_width)
+        if key != self._plate_key or self._plate_pixmap is None:
+            self._plate_pixmap = self._render_plate_pixmap(p, scale)
+            self._plate_key = key
+        painter.drawPixmap(0, 0, self._plate_pixmap)
+
+        # Only text is drawn live (the plate layer above was rendered
+        # with full AA); TextAntialiasing alone keeps glyphs smooth
+        # without coverage-mask work on every fill
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.setRenderHint(QPainter.TextAntialiasing, True)
+        # Center, flip Y so positive Y is up (text pass only)
+        painter.translate(self.width() / 2, self.height() / 2)
+        painter.scale(scale, -scale)
 
         # Draw text
         line_texts = [l for l in p.lines if l.strip()]
@@ -279,6 +477,7 @@ class PreviewWidget(QWidget):
             # Flip Y back for text rendering (QPainter text is Y-down)
             painter.save()
             painter.scale(1, -1)
+            painter.setPen(QColor(0, 0, 0))
 
             for idx, (text, font_size, line_i) in enumerate(non_empty):
                 y_center = y_positions[idx]
@@ -292,41 +491,24 @@ class PreviewWidget(QWidget):
 
                 # Measure total line width and per-run widths
                 pixel_size = max(1, int(font_size))
-                run_widths = []
-                total_w = 0.0
-                max_h = 0.0
-                for run in runs:
-                    font = QFont(p.font)
-                    font.setPixelSize(pixel_size)
-                    font.setBold(run.bold)
-                    font.setItalic(run.italic)
-                    fm = QFontMetricsF(font)
-                    w = fm.horizontalAdvance(run.text)
-                    h = fm.height()
-                    run_widths.append(w)
-                    total_w += w
-                    max_h = max(max_h, h)
+                total_w, ascent, descent, run_widths = self._measure_line(
+                    p.font, pixel_size, runs
+                )
+                # Same vertical centering as a height-tall AlignVCenter
+                # rect: baseline = center + (ascent - descent) / 2
+                y_baseline = screen_y + (ascent - descent) / 2.0
 
                 # Draw each run
                 x = -total_w / 2
                 for j, run in enumerate(runs):
                     if not run.text:
                         continue
-                    font = QFont(p.font)
-                    font.setPixelSize(pixel_size)
-                    font.setBold(run.bold)
-                    font.setItalic(run.italic)
-                    font.setUnderline(run.underline)
-                    painter.setFont(font)
-                    painter.setPen(QColor(0, 0, 0))
-
-                    w = run_widths[j]
-                    painter.drawText(
-                        QRectF(x, screen_y - max_h / 2, w, max_h),
-                        Qt.AlignLeft | Qt.AlignVCenter,
-                        run.text,
-                    )
-                    x += w
+                    painter.setFont(_cached_draw_font(
+                        p.font, pixel_size, run.bold, run.italic, run.underline
+                    ))
+
+                    painter.drawText(QPointF(x, y_baseline), run.text)
+                    x += run_widths[j]
 
             painter.restore()
 
@@ -346,6 +528,14 @@ class ParameterPanel(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
 
+        # Styled-lines cache, valid for one document revision
+        self._styled_cache = None
+        self._styled_rev = -1
+
+        # Batch widget construction: every addWidget/addLayout otherwise
+        # triggers its own layout invalidation
+        self.setUpdatesEnabled(False)
+
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.NoFrame)
@@ -373,13 +563,19 @@ class ParameterPanel(QWidget):
         self.setMinimumWidth(260)
         self.setMaximumWidth(360)
 
+        self.setUpdatesEnabled(True)
+
     def _make_spinbox(self, min_val, max_val, default, decimals=1, step=1.0, suffix=" mm"):
         sb = QDoubleSpinBox()
+        # Configure silently so the initial setValue doesn't fire
+        # valueChanged before the panel is even assembled
+        sb.blockSignals(True)
         sb.setRange(min_val, max_val)
         sb.setDecimals(decimals)
         sb.setSingleStep(step)
         sb.setValue(default)
         sb.setSuffix(suffix)
+        sb.blockSignals(False)
         sb.valueChanged.connect(self._on_changed)
         return sb
 
@@ -577,11 +773,19 @@ class ParameterPanel(QWidget):
         return ["concave", "rounded", "none"][idx]
 
     def get_styled_lines(self):
-        """Extract per-run styled text from the QTextEdit."""
+        """Extract per-run styled text from the QTextEdit.
+
+        Cached per document revision: parameter changes that don't touch
+        the text (spinboxes, combos) reuse the previous walk.
+        """
         doc = self.text_edit.document()
+        rev = doc.revision()
+        if rev == self._styled_rev:
+            return self._styled_cache
+
         styled_lines = []
-        for i in range(doc.blockCount()):
-            block = doc.findBlockByNumber(i)
+        block = doc.firstBlock()
+        while block.isValid():
             runs = []
             it = block.begin()
             while not it.atEnd():
@@ -598,6 +802,10 @@ class ParameterPanel(QWidget):
             if not runs:
                 runs = [StyledRun(text="")]
             styled_lines.append(runs)
+            block = block.next()
+
+        self._styled_cache = styled_lines
+        self._styled_rev = rev
         return styled_lines
 
     def get_params(self):
@@ -665,6 +873,35 @@ class ParameterPanel(QWidget):
 # ---------------------------------------------------------------------------
 
 
+_geometry_cache = {}
+
+
+def _load_geometry():
+    """Resolve (and cache) the CadQuery-backed generation entry points.
+
+    namesign itself imports instantly, but its first geometry call pulls
+    in the OCP/OpenCascade binary, which takes seconds. Forcing that
+    here, once, means repeat exports skip the cost entirely — and the
+    preload thread below moves it into idle time after startup.
+    """
+    if not _geometry_cache:
+        from namesign import generate_sign, export_stl, _load_cq
+        _load_cq()
+        _geometry_cache["generate_sign"] = generate_sign
+        _geometry_cache["export_stl"] = export_stl
+    return _geometry_cache
+
+
+class GeometryPreloadThread(QThread):
+    """Warms the CadQuery import in the background after the window shows."""
+
+    def run(self):
+        try:
+            _load_geometry()
+        except Exception:
+            pass  # surfaced properly on the first real export
+
+
 class ExportThread(QThread):
     """Background thread for CadQuery STL generation."""
 
@@ -681,22 +918,22 @@ class ExportThread(QThread):
     def run(self):
         try:
             self.progress.emit("Importing CadQuery...")
-            from namesign import generate_sign, export_stl
+            geometry = _load_geometry()
 
             self.progress.emit("Generating geometry...")
-            black, white = generate_sign(self.params)
+            black, white = geometry["generate_sign"](self.params)
 
             black_file = str(Path(self.output_dir) / f"{self.prefix}_black.stl")
             white_file = str(Path(self.output_dir) / f"{self.prefix}_white.stl")
 
             if black is not None:
                 self.progress.emit("Exporting black piece...")
-                export_stl(black, black_file)
+                geometry["export_stl"](black, black_file)
             else:
                 black_file = ""
 
             self.progress.emit("Exporting white piece...")
-            export_stl(white, white_file)
+            geometry["export_stl"](white, white_file)
 
             self.finished.emit(black_file, white_file)
         except Exception as e:
@@ -720,6 +957,14 @@ class MainWindow(QMainWindow):
         self.presets_dir = Path(__file__).parent / "presets"
         self.presets_dir.mkdir(exist_ok=True)
 
+        # Coalesce rapid parameter changes (keystrokes, spinbox holds)
+        # into one preview rebuild
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(40)
+        self._preview_timer.timeout.connect(self._do_update_preview)
+        self._last_params = None
+
         self._setup_menu()
         self._setup_central_widget()
         self._setup_status_bar()
@@ -729,6 +974,10 @@ class MainWindow(QMainWindow):
 
         self._update_preview()
 
+        # Pull in CadQuery during idle time so the first export is fast
+        self._preload_thread = GeometryPreloadThread(self)
+        self._preload_thread.start()
+
     def _setup_central_widget(self):
         central = QWidget()
         self.setCentralWidget(central)
@@ -743,6 +992,10 @@ class MainWindow(QMainWindow):
         splitter.addWidget(self.parameter_panel)
 
         self.preview = PreviewWidget()
+        # paintEvent fills the whole rect, so Qt can skip its own
+        # background erase before each paint
+        self.preview.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.preview.setAutoFillBackground(False)
         splitter.addWidget(self.preview)
 
         splitter.setSizes([300, 600])
@@ -793,7 +1046,16 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Load Error", f"Failed to load preset:\n\n{e}")
 
     def _update_preview(self):
+        """Schedule a (debounced) preview rebuild."""
+        self._preview_timer.start()
+
+    def _do_update_preview(self):
         params = self.parameter_panel.get_params()
+        # Spurious signals (e.g. a formatting toggle that ends up not
+        # changing anything) shouldn't trigger a repaint
+        if params == self._last_params:
+            return
+        self._last_params = params
         self.preview.set_params(params)
 
     def _on_export(self):